@@ -1,7 +1,12 @@
 
 import numpy as np
 
-from awgn_ber.modulation import bpsk_modulate, bpsk_demodulate, qpsk_modulate, qpsk_demodulate
+from awgn_ber.channel import awgn, awgn_sweep, sweep_errors_numpy
+from awgn_ber.kernels import NUMBA_AVAILABLE
+from awgn_ber.metrics import ber, ber_packed, ber_theory_bpsk_awgn, bit_errors_packed
+from awgn_ber.modulation import (
+    bpsk_demodulate, bpsk_modulate, demodulate, modulate, qpsk_demodulate, qpsk_modulate,
+)
 
 bits = np.random.randint(0, 2, 20, dtype=np.uint8)
 
@@ -16,3 +21,87 @@ sq = qpsk_modulate(bits2)
 bh2 = qpsk_demodulate(sq)
 print("QPSK ok:", np.all(bits2 == bh2))
 
+
+# Batched AWGN: one row per SNR point, dtype kind preserved
+ys = awgn_sweep(s, [0.0, 5.0, 10.0], rng=np.random.default_rng(0))
+ysq = awgn_sweep(sq, [0.0, 5.0, 10.0], rng=np.random.default_rng(0))
+print("awgn_sweep ok:", ys.shape == (3, s.size) and ys.dtype == np.float64
+      and ysq.shape == (3, sq.size) and ysq.dtype == np.complex128)
+
+# Memory-bounded sweep: block size does not change the error counts
+bits_sw = np.random.default_rng(10).integers(0, 2, 2 * 5003, dtype=np.uint8)
+for scheme in ("bpsk", "qpsk"):
+    e_one = sweep_errors_numpy(bits_sw, [0.0, 2.0, 4.0, 6.0], scheme=scheme,
+                               rng=np.random.default_rng(11))
+    e_blk = sweep_errors_numpy(bits_sw, [0.0, 2.0, 4.0, 6.0], scheme=scheme,
+                               rng=np.random.default_rng(11), max_block_samples=15_000)
+    print(f"sweep_errors_numpy {scheme} blocks ok:", np.array_equal(e_one, e_blk))
+
+# float32 path: float32 / complex64 symbols and noise, decisions unchanged
+s32 = modulate(bits, "bpsk", dtype=np.float32)
+sq32 = modulate(bits2, "qpsk", dtype=np.float32)
+print("float32 dtypes ok:", s32.dtype == np.float32 and sq32.dtype == np.complex64)
+print("BPSK float32 ok:", np.all(demodulate(s32, "bpsk") == bits))
+print("QPSK float32 ok:", np.all(demodulate(sq32, "qpsk") == bits2))
+y32 = awgn(sq32, 30.0, rng=np.random.default_rng(0), dtype=np.float32)
+print("QPSK float32 AWGN ok:", y32.dtype == np.complex64 and np.all(demodulate(y32, "qpsk") == bits2))
+
+# float32 BER matches theory within Monte Carlo noise (5 standard deviations)
+n_mc = 200_000
+bits_mc = np.random.default_rng(1).integers(0, 2, n_mc, dtype=np.uint8)
+y_mc = awgn(modulate(bits_mc, "bpsk", dtype=np.float32), 4.0,
+            rng=np.random.default_rng(2), dtype=np.float32)
+p_th = float(ber_theory_bpsk_awgn(4.0))
+p_mc = ber(bits_mc, demodulate(y_mc, "bpsk"))
+print("BPSK float32 BER ok:", abs(p_mc - p_th) < 5 * np.sqrt(p_th * (1 - p_th) / n_mc))
+
+# Packed error counting matches the unpacked count (N not a multiple of 8, batched rows)
+n_odd = 1003
+bits_odd = np.random.default_rng(3).integers(0, 2, n_odd, dtype=np.uint8)
+y_odd = awgn_sweep(modulate(bits_odd, "bpsk"), [0.0, 3.0, 6.0], rng=np.random.default_rng(4))
+rx = demodulate(y_odd, "bpsk")
+rx_packed = demodulate(y_odd, "bpsk", packed=True)
+tx_packed = np.packbits(bits_odd)
+print("packed batched ok:", np.array_equal(bit_errors_packed(tx_packed, rx_packed),
+                                           np.count_nonzero(bits_odd ^ rx, axis=1)))
+print("packed 1D ok:", bit_errors_packed(tx_packed, rx_packed[0]) == np.count_nonzero(bits_odd ^ rx[0])
+      and ber_packed(tx_packed, rx_packed[0], n_odd) == ber(bits_odd, rx[0]))
+
+bits_q = np.random.default_rng(5).integers(0, 2, 2 * 501, dtype=np.uint8)
+yq = awgn_sweep(modulate(bits_q, "qpsk"), [0.0, 3.0], rng=np.random.default_rng(6))
+print("packed QPSK ok:", np.array_equal(
+    bit_errors_packed(np.packbits(bits_q), demodulate(yq, "qpsk", packed=True)),
+    np.count_nonzero(bits_q ^ demodulate(yq, "qpsk"), axis=1)))
+
+# Reusable noise buffer: result is written into (and is a view of) out_noise
+buf = np.empty(2 * sq.size, dtype=np.float64)
+yb = awgn(sq, 10.0, rng=np.random.default_rng(7), out_noise=buf)
+yb_ref = awgn(sq, 10.0, rng=np.random.default_rng(7))
+print("out_noise ok:", yb.dtype == np.complex128 and yb.shape == sq.shape
+      and np.shares_memory(yb, buf) and np.array_equal(yb, yb_ref))
+buf_sweep = np.empty((2, s.size), dtype=np.float32)
+ysb = awgn_sweep(s, [0.0, 5.0], rng=np.random.default_rng(8), dtype=np.float32, out_noise=buf_sweep)
+print("out_noise sweep ok:", ysb.dtype == np.float32 and ysb.shape == (2, s.size)
+      and np.shares_memory(ysb, buf_sweep))
+
+# Fused Numba sweep: same seed -> same error counts, independent of thread count
+# (set NUMBA_NUM_THREADS=4 to exercise several threads on a small machine)
+if NUMBA_AVAILABLE:
+    import numba
+    from awgn_ber.kernels import CHUNK_BITS, simulate_bpsk_errors, sweep_errors
+
+    bits_nb = np.random.default_rng(9).integers(0, 2, 3 * CHUNK_BITS + 11, dtype=np.uint8)
+    n_threads = numba.config.NUMBA_NUM_THREADS
+    e_a = sweep_errors(bits_nb, [0.0, 4.0], scheme="bpsk", seed=1)
+    e_b = sweep_errors(bits_nb, [0.0, 4.0], scheme="bpsk", seed=1)
+    numba.set_num_threads(1)
+    e_1 = sweep_errors(bits_nb, [0.0, 4.0], scheme="bpsk", seed=1)
+    numba.set_num_threads(n_threads)
+    print(f"Numba reproducible ok ({n_threads} threads):",
+          np.array_equal(e_a, e_b) and np.array_equal(e_a, e_1))
+
+    e_single = [simulate_bpsk_errors(bits_nb, 4.0, seed=3) for _ in range(2)]
+    print("Numba simulate_bpsk_errors ok:", e_single[0] == e_single[1]
+          and e_single[0] == sweep_errors(bits_nb, [4.0], scheme="bpsk", seed=3)[0])
+else:
+    print("Numba reproducible: skipped (numba not installed)")
@@ -17,42 +17,116 @@ Noise:
 
 
 from __future__ import annotations
+import math
+
 import numpy as np
 
+from awgn_ber.metrics import bit_errors_packed
+from awgn_ber.modulation import demodulate, modulate
+from awgn_ber.utils import INV_SQRT2, complex_dtype, real_dtype
+
+# Upper bound on real noise samples per SNR block in sweep_errors_numpy
+# (2**24 float64 = 128 MB)
+MAX_BLOCK_SAMPLES = 1 << 24
+
+# 10**(snr_db/10) == exp(snr_db * ln(10)/10); exp is SIMD-vectorized, pow is not
+_LN10_OVER_10 = math.log(10.0) / 10.0
+
 
 def snr_db_to_linear(snr_db: float | np.ndarray) -> float | np.ndarray:
     """ Convert SNR from dB to linear scale."""
-    return np.power(10.0, np.asarray(snr_db, dtype=np.float64)/10.0)
+    return np.exp(np.asarray(snr_db, dtype=np.float64) * _LN10_OVER_10)
 
 
-def noise_variance_awgn(snr_db: float, *, complex_noise: bool)-> float:
+def noise_variance_awgn(snr_db: float | np.ndarray, *, complex_noise: bool)-> float | np.ndarray:
     """
     Compute AWGN noise variance given SNR in dB.
 
     Args:
-        snr_db (float): SNR in dB (interpreted as Es/N0 with Es=1)
+        snr_db (float | np.ndarray): SNR in dB (interpreted as Es/N0 with Es=1).
+        An array of SNR points gives all variances in one call.
         complex_noise (bool): 
         - If True, return variance for complex circular noise CN(0, sigma2).
         - If False, return variance for real noise N(0, sigma2).
     Returns:
-        float: Noise variance sigma^2.
+        float | np.ndarray: Noise variance sigma^2 (float for scalar snr_db,
+        array of the same shape otherwise).
     """
     
-    snr_lin = float(snr_db_to_linear(snr_db))
-    if snr_lin <= 0.0:
+    snr_lin = snr_db_to_linear(snr_db)
+    if np.any(snr_lin <= 0.0):
         raise ValueError("snr_db must correpond to a positve linear SNR")
     
     if complex_noise:
         # CN(0, sigma2) -> E[|n|^2] = sigma2, Re/Im var = sigma2/2
-        return 1.0/snr_lin
+        sigma2 = 1.0/snr_lin
     else:
         # N(0, sigma2) for real BPSK with Es=1: sigma2 = N0/2 = 1/(2*SNR)
-        return 1.0/(2.0 * snr_lin)
+        sigma2 = 1.0/(2.0 * snr_lin)
+    return float(sigma2) if np.ndim(sigma2) == 0 else sigma2
+
+
+def per_bit_noise(
+        snr_db: np.ndarray | list[float],
+        scheme: str,
+        n_bits: int,
+) -> tuple[float, np.ndarray]:
+    """
+    Per-bit amplitude and noise std for fused BPSK/QPSK simulations.
+
+    Gray-coded QPSK with Es=1 is two independent antipodal decisions per
+    symbol (amplitude 1/sqrt(2) on I and Q, real noise variance sigma2/2 each),
+    so both schemes reduce to y = amplitude * (1 - 2*b) + sigma * n per bit.
+    The fused Numba and CuPy sweeps simulate every bit this way.
+
+    Args:
+        snr_db (np.ndarray | list[float]): M SNR points in dB (Es/N0 with Es=1)
+        scheme (str): 'bpsk' or 'qpsk'
+        n_bits (int): Number of transmitted bits (must be even for QPSK).
+
+    Returns:
+        tuple[float, np.ndarray]: Symbol amplitude per bit and noise std of
+        shape (M,), one per SNR point.
+    """
+    snr_db = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+    if snr_db.ndim != 1:
+        raise ValueError("snr_db must be a scalar or a 1D array")
+
+    scheme = scheme.lower().strip()
+    if scheme == 'bpsk':
+        return 1.0, np.sqrt(noise_variance_awgn(snr_db, complex_noise=False))
+    if scheme == 'qpsk':
+        if n_bits % 2 != 0:
+            raise ValueError("Number of bits must be even for QPSK modulation")
+        return INV_SQRT2, np.sqrt(noise_variance_awgn(snr_db, complex_noise=True) / 2.0)
+    raise ValueError(f"Unsupported modulation scheme: {scheme}")
+
+
+def _draw_noise(
+        rng: np.random.Generator,
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+        out: np.ndarray | None,
+) -> np.ndarray:
+    """Draw standard normal samples, into `out` when a scratch buffer is given."""
+    if out is None:
+        return rng.standard_normal(shape, dtype=dtype)
+    if out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+        raise ValueError(
+            f"out_noise must be a C-contiguous {dtype} array of shape {shape}, "
+            f"got {out.dtype} array of shape {out.shape}"
+        )
+    rng.standard_normal(dtype=dtype, out=out)
+    return out
+
     
 def awgn(
         x: np.ndarray,
         snr_db: float,
         rng: np.random.Generator | None = None,
+        *,
+        dtype: np.dtype | type = np.float64,
+        out_noise: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Pass signal x through AWGN channel at given SNR (dB)
@@ -65,10 +139,18 @@ def awgn(
         snr_db (float): SNR in dB (interpreted as Es/N0 with Es=1)
         rng (np.random.Generator | None, optional
         Random generator for reproducibility. If None, uses default_rng().
+        dtype (np.dtype | type, optional): Real precision of the noise and output,
+        np.float64 (default) or np.float32 (complex64 for complex x).
+        out_noise (np.ndarray | None, optional): Reusable scratch buffer of the
+        given dtype, shape (N,) for real x or (2N,) for complex x. The noise and
+        the result are written into it, so repeated calls (e.g. an SNR loop)
+        allocate nothing; the returned array is a view of out_noise and is
+        overwritten by the next call that reuses it.
 
     Returns:
         np.ndarray: Noisy observation y = x + n, same dtype kind as x.
     """
+    dtype = real_dtype(dtype)
     x = np.asarray(x)
     if x.ndim != 1:
         raise ValueError("x must be a 1D array")
@@ -76,16 +158,127 @@ def awgn(
     if rng is None:
         rng = np.random.default_rng()
         
+    # Noise is drawn straight into the output buffer, scaled and summed with x
+    # in place, so only one array of the output size is allocated.
     if np.iscomplexobj(x):
         sigma2 = noise_variance_awgn(snr_db, complex_noise=True)
         sigma = np.sqrt(sigma2 / 2.0) 
-        n = rng.normal(0.0, sigma, size=x.shape) + 1j * rng.normal(0.0, sigma, size=x.shape)
-        return (x.astype(np.complex128, copy=False) + n.astype(np.complex128))
+        # 2N interleaved (Re, Im) draws viewed as N complex samples
+        y = _draw_noise(rng, (2 * x.size,), dtype, out_noise).view(complex_dtype(dtype))
     else:
         sigma2 = noise_variance_awgn(snr_db, complex_noise=False)
         sigma = np.sqrt(sigma2)
-        n = rng.normal(0.0, sigma, size=x.shape)
-        return x.astype(np.float64, copy=False) + n.astype(np.float64)
-    
-    
-    
\ No newline at end of file
+        y = _draw_noise(rng, (x.size,), dtype, out_noise)
+    y *= sigma
+    y += x
+    return y
+
+
+def awgn_sweep(
+        x: np.ndarray,
+        snr_db: np.ndarray | list[float],
+        rng: np.random.Generator | None = None,
+        *,
+        dtype: np.dtype | type = np.float64,
+        out_noise: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Pass signal x through AWGN at several SNR points in one batch.
+
+    Row m of the result is x plus noise at snr_db[m], with the same noise
+    model as awgn(). All rows are generated with a single RNG call.
+
+    Args:
+        x (np.ndarray): Input signal (1D array of N samples). Can be real or complex.
+        snr_db (np.ndarray | list[float]): M SNR points in dB (Es/N0 with Es=1)
+        rng (np.random.Generator | None, optional
+        Random generator for reproducibility. If None, uses default_rng().
+        dtype (np.dtype | type, optional): Real precision of the noise and output,
+        np.float64 (default) or np.float32 (complex64 for complex x).
+        out_noise (np.ndarray | None, optional): Reusable scratch buffer of the
+        given dtype, shape (M, N) for real x or (M, 2N) for complex x; see awgn().
+
+    Returns:
+        np.ndarray: Noisy observations of shape (M, N), same dtype kind as x.
+    """
+    dtype = real_dtype(dtype)
+    x = np.asarray(x)
+    if x.ndim != 1:
+        raise ValueError("x must be a 1D array")
+
+    snr_db = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+    if snr_db.ndim != 1:
+        raise ValueError("snr_db must be a scalar or a 1D array")
+
+    if rng is None:
+        rng = np.random.default_rng()
+
+    m = snr_db.size
+    if np.iscomplexobj(x):
+        sigma2 = noise_variance_awgn(snr_db, complex_noise=True)
+        sigma = np.sqrt(sigma2 / 2.0)
+        y = _draw_noise(rng, (m, 2 * x.size), dtype, out_noise).view(complex_dtype(dtype))
+    else:
+        sigma2 = noise_variance_awgn(snr_db, complex_noise=False)
+        sigma = np.sqrt(sigma2)
+        y = _draw_noise(rng, (m, x.size), dtype, out_noise)
+    y *= sigma[:, None].astype(dtype)
+    y += x
+    return y
+
+
+def sweep_errors_numpy(
+        bits_tx: np.ndarray,
+        snr_db: np.ndarray | list[float],
+        *,
+        scheme: str,
+        rng: np.random.Generator | None = None,
+        dtype: np.dtype | type = np.float64,
+        max_block_samples: int = MAX_BLOCK_SAMPLES,
+) -> np.ndarray:
+    """
+    Count bit errors at several SNR points with the NumPy pipeline.
+
+    bits_tx is modulated once; the SNR points are then pushed through
+    awgn_sweep() in blocks of as many rows as fit in max_block_samples real
+    noise samples (at least one row per block), so peak memory stays bounded
+    for large N. All blocks reuse one noise buffer and draw from rng in the
+    same order as a single call, so the counts do not depend on the block size.
+
+    Args:
+        bits_tx (np.ndarray): Transmitted bits (1D array of 0s and 1s).
+        snr_db (np.ndarray | list[float]): M SNR points in dB (Es/N0 with Es=1)
+        scheme (str): 'bpsk' or 'qpsk'
+        rng (np.random.Generator | None, optional
+        Random generator for reproducibility. If None, uses default_rng().
+        dtype (np.dtype | type, optional): Real precision of symbols and noise,
+        np.float64 (default) or np.float32.
+        max_block_samples (int, optional): Upper bound on real noise samples
+        per block (default: MAX_BLOCK_SAMPLES).
+
+    Returns:
+        np.ndarray: Error counts of shape (M,), one per SNR point (int64).
+    """
+    dtype = real_dtype(dtype)
+    snr_db = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+    if snr_db.ndim != 1:
+        raise ValueError("snr_db must be a scalar or a 1D array")
+    if rng is None:
+        rng = np.random.default_rng()
+
+    x = modulate(bits_tx, scheme, dtype=dtype)
+    n_real = 2 * x.size if np.iscomplexobj(x) else x.size
+    rows = max(1, max_block_samples // max(n_real, 1))
+    m = snr_db.size
+
+    tx_packed = np.packbits(np.asarray(bits_tx, dtype=np.uint8))
+    scratch = np.empty((min(rows, m), n_real), dtype=dtype)
+    errors = np.empty(m, dtype=np.int64)
+    for start in range(0, m, rows):
+        block = snr_db[start:start + rows]
+        # Row k of y / bits_rx belongs to block[k]
+        y = awgn_sweep(x, block, rng=rng, dtype=dtype, out_noise=scratch[:block.size])
+        # Packed decisions: error counting touches N/8 bytes per row
+        bits_rx = demodulate(y, scheme, packed=True)
+        errors[start:start + block.size] = bit_errors_packed(tx_packed, bits_rx)
+    return errors
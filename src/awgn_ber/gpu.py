@@ -0,0 +1,76 @@
+"""
+GPU batched Monte Carlo BER sweeps (optional, requires CuPy).
+
+The (SNR point, bit) grid is simulated on the device in blocks of SNR rows
+(bounded by channel.MAX_BLOCK_SAMPLES, as on the CPU path): noise for each
+block is drawn as one (rows, N) array, decisions and error counts are reduced
+per row, and only the M error counts are copied back.
+
+Both schemes are simulated as per-bit antipodal decisions (see
+channel.per_bit_noise), so no complex arrays are needed on the device.
+"""
+
+from __future__ import annotations
+import numpy as np
+
+from awgn_ber.channel import MAX_BLOCK_SAMPLES, per_bit_noise
+from awgn_ber.modulation import validate_bits
+from awgn_ber.utils import real_dtype
+
+try:
+    import cupy as cp
+    CUPY_AVAILABLE = True
+except ImportError:
+    cp = None
+    CUPY_AVAILABLE = False
+
+
+def sweep_errors_gpu(
+        bits_tx: np.ndarray,
+        snr_db: np.ndarray | list[float],
+        *,
+        scheme: str,
+        seed: int | None = None,
+        dtype: np.dtype | type = np.float32,
+        max_block_samples: int = MAX_BLOCK_SAMPLES,
+) -> np.ndarray:
+    """
+    Count bit errors at several SNR points on the GPU.
+
+    Args:
+        bits_tx (np.ndarray): Transmitted bits (1D array of 0s and 1s).
+        snr_db (np.ndarray | list[float]): M SNR points in dB (Es/N0 with Es=1)
+        scheme (str): 'bpsk' or 'qpsk'
+        seed (int | None, optional): Seed for the device random generator.
+        dtype (np.dtype | type, optional): Noise precision, np.float32 (default)
+        or np.float64.
+        max_block_samples (int, optional): Upper bound on noise samples per
+        block of SNR rows (at least one row per block).
+
+    Returns:
+        np.ndarray: Error counts of shape (M,), one per SNR point (int64, host).
+    """
+    if not CUPY_AVAILABLE:
+        raise ImportError("CuPy is required for GPU sweeps: pip install cupy-cuda12x")
+
+    dtype = real_dtype(dtype)
+    bits_tx = validate_bits(bits_tx)
+    amplitude, sigma_bit = per_bit_noise(snr_db, scheme, bits_tx.size)
+
+    rng = cp.random.default_rng(seed)
+    bits = cp.asarray(bits_tx)
+    x = (amplitude * (1.0 - 2.0 * bits.astype(dtype))).astype(dtype, copy=False)
+    sigma = cp.asarray(sigma_bit, dtype=dtype)
+
+    bits_rx_ref = bits.astype(cp.bool_)
+
+    m = sigma.size
+    rows = max(1, max_block_samples // max(bits.size, 1))
+    errors = cp.empty(m, dtype=cp.int64)
+    for start in range(0, m, rows):
+        stop = min(start + rows, m)
+        y = rng.standard_normal((stop - start, bits.size), dtype=dtype)
+        y *= sigma[start:stop, None]
+        y += x
+        errors[start:stop] = cp.count_nonzero((y < 0) != bits_rx_ref, axis=1)
+    return cp.asnumpy(errors).astype(np.int64)
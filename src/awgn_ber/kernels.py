@@ -0,0 +1,125 @@
+"""
+Fused Monte Carlo kernels for AWGN BER simulations.
+
+These kernels run modulate -> AWGN -> hard decision -> error count in a single
+pass over the bits, without materializing the symbol, noise or received-bit
+arrays. They are compiled with Numba (optional dependency, ``pip install numba``);
+without Numba the public functions raise ImportError.
+
+Noise model and conventions match channel.py / modulation.py (Es=1, SNR = Es/N0).
+
+Reproducibility: the bits are split into fixed-size chunks (CHUNK_BITS, not
+tied to the thread count) and every (SNR point, chunk) pair reseeds the
+generator of whichever thread runs it from its own seed, derived from the user
+seed with np.random.SeedSequence. A chunk is always drawn sequentially by one
+thread, so error counts for a given seed are identical across calls, processes
+and thread counts. They are statistically equivalent to, but not bit-identical
+with, the NumPy path.
+"""
+
+from __future__ import annotations
+import numpy as np
+
+from awgn_ber.channel import per_bit_noise
+from awgn_ber.modulation import validate_bits
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels below can still be defined."""
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+
+# Bits per independently seeded chunk (fixed, so results never depend on threads)
+CHUNK_BITS = 1 << 16
+
+
+def _require_numba() -> None:
+    if not NUMBA_AVAILABLE:
+        raise ImportError("Numba is required for the fused kernels: pip install numba")
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _sweep_errors_kernel(
+        bits_tx: np.ndarray, amplitude: float, sigma: np.ndarray, seeds: np.ndarray
+) -> np.ndarray:
+    n_snr, n_chunks = seeds.shape
+    counts = np.zeros((n_snr, n_chunks), dtype=np.int64)
+    # One task per (SNR point, chunk); each task seeds the running thread's
+    # generator itself, so its noise does not depend on thread scheduling.
+    for task in prange(n_snr * n_chunks):
+        m = task // n_chunks
+        c = task % n_chunks
+        np.random.seed(seeds[m, c])
+        s = sigma[m]
+        count = 0
+        for i in range(c * CHUNK_BITS, min((c + 1) * CHUNK_BITS, bits_tx.size)):
+            b = bits_tx[i]
+            y = amplitude * (1.0 - 2.0 * b) + s * np.random.standard_normal()
+            bit_rx = 1 if y < 0.0 else 0
+            if bit_rx != b:
+                count += 1
+        counts[m, c] = count
+    return counts.sum(axis=1)
+
+
+def sweep_errors(
+        bits_tx: np.ndarray,
+        snr_db: np.ndarray | list[float],
+        *,
+        scheme: str,
+        seed: int,
+) -> np.ndarray:
+    """
+    Count bit errors at several SNR points with one fused kernel.
+
+    Each SNR point is a single parallel pass over the bits: symbol lookup,
+    noise, hard decision and error accumulation per bit, with no intermediate
+    arrays. QPSK bits are simulated as in channel.per_bit_noise. Results are
+    reproducible for a given seed regardless of the Numba thread count (see
+    module docstring).
+
+    Args:
+        bits_tx (np.ndarray): Transmitted bits (1D array of 0s and 1s).
+        snr_db (np.ndarray | list[float]): M SNR points in dB (Es/N0 with Es=1)
+        scheme (str): 'bpsk' or 'qpsk'
+        seed (int): Seed from which the per-(SNR point, chunk) seeds are derived.
+
+    Returns:
+        np.ndarray: Error counts of shape (M,), one per SNR point (int64).
+    """
+    _require_numba()
+    bits_tx = np.ascontiguousarray(validate_bits(bits_tx))
+    amplitude, sigma = per_bit_noise(snr_db, scheme, bits_tx.size)
+
+    n_chunks = max(1, -(-bits_tx.size // CHUNK_BITS))
+    seeds = np.random.SeedSequence(int(seed)).generate_state(
+        sigma.size * n_chunks, dtype=np.uint32
+    ).reshape(sigma.size, n_chunks)
+    return _sweep_errors_kernel(bits_tx, amplitude, sigma, seeds)
+
+
+def simulate_bpsk_errors(bits_tx: np.ndarray, snr_db: float, seed: int) -> int:
+    """
+    Count BPSK bit errors over AWGN at one SNR point with a fused kernel.
+
+    Equivalent to sweep_errors(bits_tx, [snr_db], scheme='bpsk', seed=seed),
+    so the count is reproducible for a given seed under any thread count.
+
+    Args:
+        bits_tx (np.ndarray): Transmitted bits (1D array of 0s and 1s).
+        snr_db (float): SNR in dB (interpreted as Es/N0 with Es=1)
+        seed (int): Seed from which the per-chunk seeds are derived.
+
+    Returns:
+        int: Number of bit errors.
+    """
+    return int(sweep_errors(bits_tx, [snr_db], scheme='bpsk', seed=seed)[0])
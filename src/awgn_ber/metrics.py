@@ -1,12 +1,23 @@
 """
 Metrics for digital communication simulations.
-Currently: Bit Error Rate (BER).
+Currently: Bit Error Rate (BER), Symbol Error Rate (SER), the Q-function and
+closed-form BER references for BPSK/QPSK over AWGN.
 """
 
 from __future__ import annotations
 import numpy as np
 import math
 
+from awgn_ber.utils import INV_SQRT2
+
+try:
+    from scipy.special import erfc as _erfc
+except ImportError:  # scipy is optional; fall back to a (slow) elementwise math.erfc
+    _erfc = np.frompyfunc(math.erfc, 1, 1)
+
+# Set-bit count of every byte value, used when np.bitwise_count (NumPy >= 2.0) is missing
+_POPCOUNT8 = np.array([bin(v).count("1") for v in range(256)], dtype=np.uint8)
+
 def ber(bits_tx: np.ndarray, bits_rx: np.ndarray) -> float:
     """
     Compute Bit Error Rate (BER) between transmitted and received bits.
@@ -33,16 +44,67 @@ def ber(bits_tx: np.ndarray, bits_rx: np.ndarray) -> float:
     tx = tx.astype(np.uint8, copy=False)
     rx = rx.astype(np.uint8, copy=False)
 
-    # Optional strict validation (uncomment if you want hard enforcement)
-    if np.any((tx != 0) & (tx != 1)) or np.any((rx != 0) & (rx != 1)):
-        raise ValueError("bits_tx must contain only 0s and 1s")
+    # Strict validation as a single max() reduction per array (no bool temporaries)
+    if tx.max() > 1 or rx.max() > 1:
+        raise ValueError("bits_tx and bits_rx must contain only 0s and 1s")
     
-    errors = np.sum(tx != rx)
+    errors = np.count_nonzero(np.bitwise_xor(tx, rx))
     ber_value = errors / tx.size
     return ber_value
 
 
 
+def bit_errors_packed(tx_packed: np.ndarray, rx_packed: np.ndarray) -> int | np.ndarray:
+    """
+    Count bit errors between packed bitstreams (np.packbits layout).
+
+    XOR of the packed bytes followed by a popcount touches N/8 bytes instead
+    of N. Zero padding in the last byte is identical on both sides, so it
+    never contributes errors.
+
+    Args:
+        tx_packed (np.ndarray): 
+            Packed transmitted bits, uint8 of shape (..., ceil(N/8)).
+        rx_packed (np.ndarray): 
+            Packed received bits, broadcastable against tx_packed
+            (e.g. shape (M, ceil(N/8)) for one row per SNR point).
+    Returns:
+        int | np.ndarray: Error count (per row for batched input).
+    """
+    tx = np.asarray(tx_packed, dtype=np.uint8)
+    rx = np.asarray(rx_packed, dtype=np.uint8)
+    if tx.shape[-1] != rx.shape[-1]:
+        raise ValueError(f"Shape mismatch: tx_packed has {tx.shape}, rx_packed has {rx.shape}")
+
+    diff = np.bitwise_xor(tx, rx)
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(diff)
+    else:
+        counts = _POPCOUNT8[diff]
+    errors = counts.sum(axis=-1, dtype=np.int64)
+    return int(errors) if errors.ndim == 0 else errors
+
+
+def ber_packed(tx_packed: np.ndarray, rx_packed: np.ndarray, n_bits: int) -> float:
+    """
+    Bit Error Rate (BER) between packed bitstreams (np.packbits layout).
+
+    Args:
+        tx_packed (np.ndarray): Packed transmitted bits, 1D uint8.
+        rx_packed (np.ndarray): Packed received bits, same shape as tx_packed.
+        n_bits (int): Number of valid (unpacked) bits.
+    Returns:
+        float: Bit Error Rate (BER).
+    """
+    tx = np.asarray(tx_packed)
+    rx = np.asarray(rx_packed)
+    if tx.ndim != 1 or rx.ndim != 1:
+        raise ValueError("tx_packed and rx_packed must be 1D arrays")
+    if n_bits <= 0 or (n_bits + 7) // 8 != tx.size:
+        raise ValueError(f"n_bits={n_bits} does not match {tx.size} packed bytes")
+    return bit_errors_packed(tx, rx) / n_bits
+
+
 def ser(symbols_tx: np.ndarray, symbols_rx: np.ndarray) -> float:
     """
     Optional: Symbol Error Rate (SER) for symbols (useful later).
@@ -73,8 +135,7 @@ def qfunc(x: np.ndarray | float) -> np.ndarray | float:
     Works for float or Numpy arrays.
     """
     x_arr = np.asarray(x, dtype=np.float64)
-    erfc_vec = np.vectorize(math.erfc)
-    return 0.5 * erfc_vec(x_arr / np.sqrt(2.0))
+    return 0.5 * np.asarray(_erfc(x_arr * INV_SQRT2), dtype=np.float64)
 
 def ber_theory_bpsk_awgn(snr_db: np.ndarray | float, *, snr_def: str = "EsN0") -> np.ndarray:
     
@@ -6,6 +6,8 @@ Conventions:
 - Bits are numpy arrays of dtype uint8 containing {0, 1}.
 - BPSK symbols are real float64 values in {-1.0, +1.0}.
 - QPSK symbols are complex128 with Gray mapping and unit average symbol energy (Es=1).
+- Passing dtype=np.float32 to the modulators yields float32 / complex64 symbols;
+  the demodulators keep float32 / complex64 input in its precision.
 
 QPSK Gray mapping (2 bits -> 1 symbol):
     b0 b1 : symbol
@@ -19,10 +21,14 @@ Normalization: divide by sqrt(2) so Es = E[|s|^2] = 1.
 
 from __future__ import annotations
 
-
 import numpy as np
 
-def _validate_bits(bits: np.ndarray) -> np.ndarray:
+from awgn_ber.utils import INV_SQRT2, complex_dtype, real_dtype
+
+# Bit -> BPSK symbol table: 0 -> +1.0, 1 -> -1.0
+_BPSK_LUT = np.array([1.0, -1.0], dtype=np.float64)
+
+def validate_bits(bits: np.ndarray) -> np.ndarray:
     """
     Args:
         bits (np.ndarray): 
@@ -39,17 +45,17 @@ def _validate_bits(bits: np.ndarray) -> np.ndarray:
     bits = np.asarray(bits)
     if bits.ndim != 1:
         raise ValueError("bits must be a 1D array of shape (N,)")
-    # Accept bool or integer, convert to uint8
+    # Accept bool or integer, convert to uint8 (bool input is valid by construction)
     if bits.dtype == np.bool_:
-        bits = bits.astype(np.uint8)
-    else:
-        bits = bits.astype(np.uint8, copy=False)
+        return bits.view(np.uint8)
+    bits = bits.astype(np.uint8, copy=False)
 
-    if np.any((bits != 0) & (bits != 1)):
+    # Single max() reduction: no boolean temporaries, one pass over the bits
+    if bits.size and bits.max() > 1:
         raise ValueError("bits array must contain only 0s and 1s")
     return bits
 
-def bpsk_modulate(bits: np.ndarray) -> np.ndarray:
+def bpsk_modulate(bits: np.ndarray, *, dtype: np.dtype | type = np.float64) -> np.ndarray:
     """
     BPSK modulation.
 
@@ -57,37 +63,50 @@ def bpsk_modulate(bits: np.ndarray) -> np.ndarray:
     ----------
     bits : np.ndarray
         Input bits of shape (N,).
+    dtype : np.dtype | type, optional
+        Symbol precision, np.float64 (default) or np.float32.
 
     Returns
     -------
     np.ndarray
         BPSK symbols of shape (N,), values in {-1.0, +1.0}.
     """
-    bits = _validate_bits(bits)
-    symbols = 1.0 - 2.0 * bits.astype(np.float64)
+    bits = validate_bits(bits)
+    symbols = _BPSK_LUT.astype(real_dtype(dtype), copy=False)[bits]
     return symbols
 
-def bpsk_demodulate(symbols: np.ndarray) -> np.ndarray:
+def bpsk_demodulate(symbols: np.ndarray, *, packed: bool = False) -> np.ndarray:
     """
     BPSK demodulation.
 
     Parameters
     ----------
     symbols : np.ndarray
-        BPSK symbols of shape (N,), values in {-1.0, +1.0}.
+        BPSK symbols of shape (N,), values in {-1.0, +1.0}, or a batch of
+        shape (M, N) (e.g. one row per SNR point).
+    packed : bool, optional
+        If True, return the bits packed 8 per byte along the last axis
+        (np.packbits layout), for use with metrics.bit_errors_packed.
 
     Returns
     -------
     np.ndarray
-        Demodulated bits of shape (N,).
+        Demodulated bits of shape (N,), or (M, N) for batched input
+        (ceil(N/8) bytes per row when packed).
     """
-    symbols = np.asarray(symbols, dtype=np.float64)
-    if symbols.ndim != 1:
-        raise ValueError("symbols must be a 1D array of shape (N,)")
-    bits = (symbols < 0).astype(np.uint8)
+    symbols = np.asarray(symbols)
+    if symbols.dtype != np.float32:
+        symbols = symbols.astype(np.float64, copy=False)
+    if symbols.ndim not in (1, 2):
+        raise ValueError("symbols must be a 1D array of shape (N,) or 2D of shape (M, N)")
+    if packed:
+        return np.packbits(symbols < 0.0, axis=-1)
+    # Compare straight into the uint8 output (no intermediate bool array)
+    bits = np.empty(symbols.shape, dtype=np.uint8)
+    np.less(symbols, 0.0, out=bits)
     return bits
 
-def qpsk_modulate(bits: np.ndarray) -> np.ndarray:
+def qpsk_modulate(bits: np.ndarray, *, dtype: np.dtype | type = np.float64) -> np.ndarray:
     """
     QPSK modulation with Gray mapping and unit average symbol energy.
 
@@ -95,91 +114,101 @@ def qpsk_modulate(bits: np.ndarray) -> np.ndarray:
     ----------
     bits : np.ndarray
         Input bits of shape (N,), where N is even.
+    dtype : np.dtype | type, optional
+        Real precision of the I/Q components, np.float64 (default) or
+        np.float32 (complex64 symbols).
 
     Returns
     -------
     np.ndarray
-        QPSK symbols of shape (N/2,), complex128 with unit average symbol energy.
+        QPSK symbols of shape (N/2,), complex128 (complex64 for float32)
+        with unit average symbol energy.
     """
-    bits = _validate_bits(bits)
+    bits = validate_bits(bits)
     if bits.size % 2 != 0:
         raise ValueError("Number of bits must be even for QPSK modulation")
     
-    bit_pairs = bits.reshape(-1, 2)
-    mapping = {
-        (0, 0): 1 + 1j,
-        (0, 1): -1 + 1j,
-        (1, 1): -1 - 1j,
-        (1, 0): 1 - 1j,
-    }
-    
-    symbols = np.array([mapping[tuple(pair)] for pair in bit_pairs], dtype=np.complex128)
-    symbols /= np.sqrt(2.0) # Normalize to unit average symbol energy
+    # Gray mapping: b0 selects the sign of Q, b1 selects the sign of I
+    b = bits.reshape(-1, 2).astype(real_dtype(dtype))
+    i = 1.0 - 2.0 * b[:, 1]
+    q = 1.0 - 2.0 * b[:, 0]
+
+    symbols = np.empty(b.shape[0], dtype=complex_dtype(dtype))
+    symbols.real = i
+    symbols.imag = q
+    symbols *= INV_SQRT2 # Normalize to unit average symbol energy
     return symbols
 
 
-def qpsk_demodulate(symbols: np.ndarray) -> np.ndarray:
+def qpsk_demodulate(symbols: np.ndarray, *, packed: bool = False) -> np.ndarray:
     """
     Hard-decision Gray-coded QPSK demodulation.
     
     Parameters
     ----------
     symbols : np.ndarray
-        QPSK symbols of shape (N/2,), complex128.
+        QPSK symbols of shape (N/2,), complex128 or complex64, or a batch of
+        shape (M, N/2).
+    packed : bool, optional
+        If True, return the bits packed 8 per byte along the last axis
+        (np.packbits layout), for use with metrics.bit_errors_packed.
     Returns
     ------- 
     np.ndarray
-        Demodulated bits of shape (N,).
+        Demodulated bits of shape (N,), or (M, N) for batched input
+        (ceil(N/8) bytes per row when packed).
     """
-    s = np.asarray(symbols, dtype=np.complex128)
-    if s.ndim != 1:
-        raise ValueError("symbols must be a 1D array")
-
-    # Undo normalization (optional, decision works either way)
-    s = s * np.sqrt(2.0)
-
-    real = np.real(s)
-    imag = np.imag(s)
-
-    b0 = (imag < 0).astype(np.uint8)
-    b1 = (real < 0).astype(np.uint8)
-
-    bits = np.empty(2 * s.size, dtype=np.uint8)
-    bits[0::2] = b0
-    bits[1::2] = b1
+    s = np.asarray(symbols)
+    if s.ndim not in (1, 2):
+        raise ValueError("symbols must be a 1D array or a 2D batch of shape (M, N/2)")
+    # ascontiguousarray promotes 0-d input to 1-D, so it runs after the ndim check
+    s = np.ascontiguousarray(s, dtype=np.complex64 if s.dtype == np.complex64 else np.complex128)
+
+    # Decisions are sign checks, so the sqrt(2) normalization is irrelevant.
+    # One contiguous (SIMD) comparison over the interleaved (Re, Im) real
+    # view yields (b1, b0) per symbol; swapping the two bytes of each pair
+    # (as a uint16 byteswap) gives the Gray order (b0, b1) = (Im < 0, Re < 0).
+    iq = s.view(s.real.dtype)
+    bits = np.empty(iq.shape, dtype=np.uint8)
+    np.less(iq, 0.0, out=bits)
+    bits.view(np.uint16).byteswap(inplace=True)
+    if packed:
+        return np.packbits(bits, axis=-1)
     return bits
 
     
     
     
-def modulate(bits: np.ndarray, scheme:str) -> np.ndarray:
+def modulate(bits: np.ndarray, scheme:str, *, dtype: np.dtype | type = np.float64) -> np.ndarray:
     """
     General modulation dispatcher.
     scheme: 'bpsk' or 'qpsk'
+    dtype: real symbol precision, np.float64 (default) or np.float32
 
     """
     scheme = scheme.lower().strip()
     if scheme == 'bpsk':
-        return bpsk_modulate(bits)
+        return bpsk_modulate(bits, dtype=dtype)
     
     if scheme == 'qpsk':
-        return qpsk_modulate(bits)
+        return qpsk_modulate(bits, dtype=dtype)
     
     raise ValueError(f"Unsupported modulation scheme: {scheme}")
 
 
-def demodulate(symbols: np.ndarray, scheme:str) -> np.ndarray:
+def demodulate(symbols: np.ndarray, scheme:str, *, packed: bool = False) -> np.ndarray:
     """
     General demodulation dispatcher.
     scheme: 'bpsk' or 'qpsk'
+    packed: return bits packed 8 per byte (np.packbits layout)
 
     """
     scheme = scheme.lower().strip()
     if scheme == 'bpsk':
-        return bpsk_demodulate(symbols)
+        return bpsk_demodulate(symbols, packed=packed)
     
     if scheme == 'qpsk':
-        return qpsk_demodulate(symbols)
+        return qpsk_demodulate(symbols, packed=packed)
     
     raise ValueError(f"Unsupported modulation scheme: {scheme}")
 
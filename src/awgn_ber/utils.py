@@ -0,0 +1,33 @@
+"""
+Common helpers shared by the simulation blocks.
+"""
+
+from __future__ import annotations
+import math
+
+import numpy as np
+
+# QPSK normalization (unit symbol energy) and the Q-function argument scale
+INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+
+def real_dtype(dtype: np.dtype | type) -> np.dtype:
+    """
+    Validate the floating-point precision used for symbols and noise.
+
+    Args:
+        dtype (np.dtype | type): np.float64 (default precision) or np.float32
+        (half the memory traffic; sign decisions are unaffected in practice).
+
+    Returns:
+        np.dtype: The validated real dtype.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    return dtype
+
+
+def complex_dtype(dtype: np.dtype | type) -> np.dtype:
+    """Complex dtype matching a real precision: float32 -> complex64, float64 -> complex128."""
+    return np.result_type(real_dtype(dtype), np.complex64)